@@ -1,15 +1,28 @@
 import ell
 import subprocess
-import tempfile
-import os
 import datetime
+import logging
+import os
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable, Dict, List, Optional
 from enum import Enum
 from pydantic import BaseModel, Field
 
+logger = logging.getLogger(__name__)
+
+# Base command used to run generated Julia scripts. Skipping the user's
+# startup.jl keeps every test process cheap to launch and independent of
+# interactive REPL setup.
+JULIA_COMMAND = ["julia", "--startup-file=no"]
+
+# Optional precompiled Julia system image (built with PackageCompiler.jl,
+# e.g. with Test baked in) to cut per-process JIT time.
+JULIA_SYSIMAGE = os.environ.get("AUTOCODE_JULIA_SYSIMAGE")
+if JULIA_SYSIMAGE:
+    JULIA_COMMAND.append(f"--sysimage={JULIA_SYSIMAGE}")
+
 # Enums for Test Status
-from enum import Enum
 
 class TestStatusEnum(Enum):
     PASSED = "Passed"
@@ -20,8 +33,10 @@ class TestStatusEnum(Enum):
 # Data Models
 
 class TestResult:
+    __slots__ = ("result_id", "test_id", "function_id", "execution_date", "actual_result", "status")
+
     def __init__(self, test_id: str, function_id: str, actual_result: str, status: TestStatusEnum):
-        self.result_id = str(uuid.uuid4())
+        self.result_id = uuid.uuid4().hex
         self.test_id = test_id
         self.function_id = function_id
         self.execution_date = datetime.datetime.now()
@@ -34,8 +49,10 @@ class TestResult:
 
 
 class Modification:
+    __slots__ = ("modification_id", "function_id", "modifier", "modification_date", "description")
+
     def __init__(self, function_id: str, modifier: str, description: str):
-        self.modification_id = str(uuid.uuid4())
+        self.modification_id = uuid.uuid4().hex
         self.function_id = function_id
         self.modifier = modifier
         self.modification_date = datetime.datetime.now()
@@ -46,6 +63,8 @@ class Modification:
                 f"{self.modifier} on {self.modification_date.isoformat()}>")
 
 class UnitTest:
+    __slots__ = ("test_id", "function_id", "name", "description", "test_case")
+
     def __init__(self, function_id: str, name: str, description: str, test_case: str):
         """
         Initialize a UnitTest instance.
@@ -55,7 +74,7 @@ class UnitTest:
         :param description: A brief description of the unit test.
         :param test_case: The Julia code for the test case as a string.
         """
-        self.test_id = str(uuid.uuid4())
+        self.test_id = uuid.uuid4().hex
         self.function_id = function_id
         self.name = name
         self.description = description
@@ -68,7 +87,7 @@ class UnitTest:
         :param function_code: The Julia code of the function under test.
         :return: An instance of TestResult containing the outcome.
         """
-        print(f"Running Test '{self.name}' for Function ID {self.function_id}")
+        logger.debug("Running Test '%s' for Function ID %s", self.name, self.function_id)
 
         # Combine the function code and test case into one Julia script
         julia_script = f"""
@@ -77,15 +96,12 @@ class UnitTest:
 {self.test_case}
 """
 
-        # Write the combined Julia script to a temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.jl', delete=False) as temp_file:
-            temp_file.write(julia_script)
-            temp_filename = temp_file.name
-
         try:
-            # Execute the Julia script using subprocess
+            # Execute the Julia script by piping it to julia's stdin ("-"),
+            # which avoids creating and removing a temporary file per test
             result = subprocess.run(
-                ["julia", temp_filename],
+                [*JULIA_COMMAND, "-"],
+                input=julia_script,
                 capture_output=True,
                 text=True
             )
@@ -102,7 +118,7 @@ class UnitTest:
                 # Test failed, capture the error message
                 status = TestStatusEnum.FAILED
                 actual_result = stderr if stderr else "Test Failed with unknown error."
-                print(f"Test Failed: {actual_result}")
+                logger.warning("Test '%s' failed: %s", self.name, actual_result)
 
             return TestResult(
                 test_id=self.test_id,
@@ -113,7 +129,7 @@ class UnitTest:
 
         except Exception as e:
             # Handle any unexpected exceptions during test execution
-            print(f"Exception during test execution: {e}")
+            logger.warning("Exception during test execution: %s", e)
             return TestResult(
                 test_id=self.test_id,
                 function_id=self.function_id,
@@ -121,16 +137,15 @@ class UnitTest:
                 status=TestStatusEnum.FAILED
             )
 
-        finally:
-            # Clean up the temporary Julia script file
-            os.remove(temp_filename)
-
     def __repr__(self):
         return (f"<UnitTest {self.test_id}: {self.name} for Function {self.function_id}>")
 
 class Function:
+    __slots__ = ("function_id", "name", "description", "code_snippet", "creation_date",
+                 "last_modified_date", "unit_tests")
+
     def __init__(self, name: str, description: str, code_snippet: str):
-        self.function_id = str(uuid.uuid4())
+        self.function_id = uuid.uuid4().hex
         self.name = name
         self.description = description
         self.code_snippet = code_snippet
@@ -140,12 +155,12 @@ class Function:
 
     def add_unit_test(self, test: UnitTest):
         self.unit_tests.append(test)
-        print(f"Added UnitTest {test.test_id} to Function {self.function_id}")
+        logger.debug("Added UnitTest %s to Function %s", test.test_id, self.function_id)
 
     def modify_code(self, new_code_snippet: str):
         self.code_snippet = new_code_snippet
         self.last_modified_date = datetime.datetime.now()
-        print(f"Function {self.function_id} code modified.")
+        logger.debug("Function %s code modified.", self.function_id)
 
     def __repr__(self):
         return (f"<Function {self.function_id}: {self.name}, "
@@ -164,39 +179,60 @@ class CodeDatabase:
     def add_function(self, name: str, description: str, code_snippet: str) -> Function:
         func = Function(name, description, code_snippet)
         self.functions[func.function_id] = func
-        self.last_modified_date = datetime.datetime.now()
-        print(f"Added Function {func.function_id}: {name}")
+        self.last_modified_date = func.creation_date
+        logger.info("Added Function %s: %s", func.function_id, name)
         return func
 
     def add_unit_test(self, function_id: str, name: str, description: str, test_case: Callable[[Callable], bool]) -> Optional[UnitTest]:
         func = self.functions.get(function_id)
         if not func:
-            print(f"Function ID {function_id} not found.")
+            logger.warning("Function ID %s not found.", function_id)
             return None
         test = UnitTest(function_id, name, description, test_case)
         func.add_unit_test(test)
         self.last_modified_date = datetime.datetime.now()
-        print(f"Added UnitTest {test.test_id} to Function {function_id}")
+        logger.info("Added UnitTest %s to Function %s", test.test_id, function_id)
         return test
 
-    def execute_tests(self):
-        print("Executing all unit tests...")
-        for func in self.functions.values():
-            for test in func.unit_tests:
-                result = test.run_test(func.code_snippet)
+    def execute_tests(self, fail_fast: bool = False, max_workers: Optional[int] = None):
+        logger.info("Executing all unit tests...")
+        jobs = [(func, test) for func in self.functions.values() for test in func.unit_tests]
+        if not jobs:
+            return
+
+        # Each test runs in its own Julia process, so threads are enough to
+        # overlap them; results are still recorded in submission order.
+        # Julia compilation is CPU-bound and each process may use more than
+        # one core while compiling, so by default use half the cores to avoid
+        # JIT thrash.
+        if max_workers is None:
+            max_workers = min(len(jobs), max(1, (os.cpu_count() or 1) // 2))
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [executor.submit(test.run_test, func.code_snippet) for func, test in jobs]
+            for future in futures:
+                result = future.result()
                 self.test_results.append(result)
-                print(f"Test Result: {result}")
+                logger.debug("Test Result: %s", result)
+                if fail_fast and result.status == TestStatusEnum.FAILED:
+                    logger.info("Stopping after first failure (fail_fast).")
+                    return
+        finally:
+            # Not a `with` block: on fail_fast we must not wait for tests that
+            # are already running. Pending tests are cancelled; running ones
+            # finish in the background and their results are discarded.
+            executor.shutdown(wait=False, cancel_futures=True)
 
     def modify_function(self, function_id: str, modifier: str, description: str, new_code_snippet: str):
         func = self.functions.get(function_id)
         if not func:
-            print(f"Function ID {function_id} not found.")
+            logger.warning("Function ID %s not found.", function_id)
             return
         func.modify_code(new_code_snippet)
         modification = Modification(function_id, modifier, description)
         self.modifications.append(modification)
-        self.last_modified_date = datetime.datetime.now()
-        print(f"Logged Modification {modification.modification_id} for Function {function_id}")
+        self.last_modified_date = func.last_modified_date
+        logger.info("Logged Modification %s for Function %s", modification.modification_id, function_id)
 
     def __repr__(self):
         return (f"<CodeDatabase: {self.db_name} v{self.db_version}, "
@@ -307,4 +343,5 @@ def test_function():
 
 # Run the integrated process
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_function()
\ No newline at end of file